@@ -3,7 +3,9 @@ DUPR API Client
 A Python client library for interacting with the DUPR (Dynamic Universal Pickleball Rating) API.
 """
 
-from .client import DUPRClient
+from .client import DUPRClient, get_default_client
+from .async_client import AsyncDUPRClient
+from ._cache import TTLCache
 from .exceptions import (
     DUPRAPIError,
     AuthenticationError,
@@ -15,6 +17,9 @@ from .exceptions import (
 __version__ = "0.1.1"
 __all__ = [
     "DUPRClient",
+    "AsyncDUPRClient",
+    "TTLCache",
+    "get_default_client",
     "DUPRAPIError",
     "AuthenticationError",
     "ValidationError",
@@ -0,0 +1,74 @@
+"""
+Response caching for the DUPR API client.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    A small thread-safe LRU cache whose entries expire after a TTL.
+
+    Used by :class:`DUPRClient` to cache idempotent GET responses keyed
+    on ``(method, path, params)``, so repeated reads of the same
+    resource skip the network entirely. Mutating endpoints purge the
+    affected path prefix via :meth:`invalidate`.
+
+    Args:
+        maxsize: Maximum number of cached responses (default: 256)
+        ttl: Seconds before a cached response expires (default: 60)
+
+    Example:
+        >>> client = DUPRClient(bearer_token="token", cache=TTLCache(ttl=30))
+        >>> client.user.get_profile()  # network
+        >>> client.user.get_profile()  # served from cache
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key``, or None if absent/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            timestamp, value = entry
+            if time.monotonic() - timestamp > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store ``value`` under ``key``, evicting the oldest entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str = ""):
+        """
+        Drop cached entries whose path starts with ``prefix``.
+
+        With no prefix, the whole cache is cleared. Keys are the
+        ``(method, path, params)`` tuples built by the client, so a
+        prefix like ``"/match/"`` purges every cached match read.
+        """
+        with self._lock:
+            if not prefix:
+                self._entries.clear()
+                return
+            stale = [key for key in self._entries if key[1].startswith(prefix)]
+            for key in stale:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
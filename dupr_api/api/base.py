@@ -1,6 +1,6 @@
 """Base API class for all endpoint implementations."""
 
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..client import DUPRClient
@@ -9,6 +9,24 @@ if TYPE_CHECKING:
 class BaseAPI:
     """Base class for all API endpoint implementations."""
 
+    # Resource root under which versioned paths are built, e.g. "/match";
+    # namespaces that set it get a precomputed default prefix
+    _resource = ""
+
     def __init__(self, client: "DUPRClient"):
         self.client = client
         self.version = client.version
+        self._prefix = f"{self._resource}/{client.version}" if self._resource else ""
+
+    def _versioned(self, suffix: str = "", version: Optional[str] = None) -> str:
+        """
+        Build a versioned endpoint path.
+
+        Reuses the prefix precomputed at construction for the default
+        version, so hot endpoints skip the per-call string formatting.
+        """
+        if version is None or version == self.version:
+            prefix = self._prefix
+        else:
+            prefix = f"{self._resource}/{version}"
+        return f"{prefix}{suffix}"
@@ -11,6 +11,8 @@ class ClubsAPI(BaseAPI):
     Handles club management, membership, and club matches.
     """
 
+    _resource = "/club"
+
     def add_club(
         self, club_data: Dict[str, Any], version: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -48,8 +50,7 @@ class ClubsAPI(BaseAPI):
         Example:
             >>> club = client.clubs.get_club(club_id=100)
         """
-        version = version or self.version
-        return self.client.get(f"/club/{version}/{club_id}")
+        return self.client.get(self._versioned(f"/{club_id}", version))
 
     def search_clubs(
         self,
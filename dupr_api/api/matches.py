@@ -1,6 +1,10 @@
 """Matches API endpoints."""
 
-from typing import Dict, Any, Optional, List
+import re
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import monotonic, perf_counter
+from typing import Dict, Any, Iterator, Optional, List
 from .base import BaseAPI
 
 
@@ -11,6 +15,55 @@ class MatchesAPI(BaseAPI):
     Handles match creation, updates, searches, and verification.
     """
 
+    _resource = "/match"
+
+    # Pages answered faster than this are considered cheap for the
+    # backend, so the adaptive pager doubles the next page size
+    _FAST_PAGE_SECONDS = 0.25
+
+    # Seconds a memoized get_match result stays valid
+    _MEMO_TTL = 30.0
+
+    # Tiny fixed-shape write envelopes ({"result": 12345} and
+    # {"success": true}) are scanned straight off the bytes instead of
+    # going through a full JSON parse; anchored to the whole envelope so
+    # anything richer falls back to the parser
+    _SCALAR_RESULT_RE = re.compile(rb'\A\s*\{\s*"result"\s*:\s*(-?\d+)\s*\}\s*\Z')
+    _SCALAR_SUCCESS_RE = re.compile(rb'\A\s*\{\s*"success"\s*:\s*(true|false)\s*\}\s*\Z')
+
+    def __init__(self, client):
+        super().__init__(client)
+        self._adaptive_limit: Optional[int] = None
+        self._last_dt: Optional[float] = None
+        # Keyed by (match_id, version) so lookups against different API
+        # versions never serve each other's bodies
+        self._match_cache: Dict[tuple, Any] = {}
+        self._match_cache_lock = Lock()
+
+    def clear_cache(self):
+        """Forget all memoized get_match results."""
+        with self._match_cache_lock:
+            self._match_cache.clear()
+
+    def _forget_match(self, match_id):
+        """Drop a match's memoized entries across every API version."""
+        with self._match_cache_lock:
+            for key in [k for k in self._match_cache if k[0] == match_id]:
+                del self._match_cache[key]
+
+    def _next_adaptive_limit(self, initial: int, cap: int) -> int:
+        """Grow the page size after fast pages, shrink it after slow ones."""
+        # The floor honours the cap too, e.g. iter_matches with a
+        # page_size below the default initial
+        floor = min(initial, cap)
+        if self._adaptive_limit is None or self._last_dt is None:
+            self._adaptive_limit = floor
+        elif self._last_dt < self._FAST_PAGE_SECONDS:
+            self._adaptive_limit = min(cap, self._adaptive_limit * 2)
+        else:
+            self._adaptive_limit = max(floor, self._adaptive_limit // 2)
+        return self._adaptive_limit
+
     def save_match(
         self, match_data: Dict[str, Any], version: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -32,8 +85,31 @@ class MatchesAPI(BaseAPI):
             ...     "scores": [{"team1": 11, "team2": 5}]
             ... })
         """
-        version = version or self.version
-        return self.client.put(f"/match/{version}/save", json_data=match_data)
+        request_raw = getattr(self.client, "_request_raw", None)
+        if request_raw is not None:
+            # Hot write path: the response is usually just the new match
+            # ID, so pull it off the bytes and skip the dict-building parse
+            response = request_raw(
+                "PUT", self._versioned("/save", version), json_data=match_data
+            )
+            scalar = self._SCALAR_RESULT_RE.match(response.content or b"")
+            if scalar is not None:
+                result = {"result": int(scalar.group(1))}
+            else:
+                result = self.client._parse_json(response)
+        else:
+            # Async client: the body arrives behind an awaitable
+            result = self.client.put(
+                self._versioned("/save", version), json_data=match_data
+            )
+        self.client._invalidate_cache("/match/")
+        # Saving is almost always followed by a get_match for the new ID,
+        # so warm that response in the background
+        match_id = result.get("result") if isinstance(result, dict) else None
+        if isinstance(match_id, int):
+            path = self._versioned(f"/{match_id}", version)
+            self.client._prefetch(path, lambda: self.client.get(path))
+        return result
 
     def update_match(
         self, match_data: Dict[str, Any], version: Optional[str] = None
@@ -55,9 +131,12 @@ class MatchesAPI(BaseAPI):
             ... })
         """
         version = version or self.version
-        return self.client.put(
+        result = self.client.put(
             f"/admin/{version}/panel/match/{version}/update", json_data=match_data
         )
+        self.client._invalidate_cache("/match/")
+        self._forget_match(match_data.get("matchId"))
+        return result
 
     def get_match(
         self, match_id: int, version: Optional[str] = None
@@ -72,11 +151,28 @@ class MatchesAPI(BaseAPI):
         Returns:
             Match details
 
+        Repeat lookups of the same match within 30 seconds are served
+        from a per-namespace memo instead of the network; writes to the
+        match invalidate its entry.
+
         Example:
             >>> match = client.matches.get_match(match_id=789)
         """
-        version = version or self.version
-        return self.client.get(f"/match/{version}/{match_id}")
+        memo_key = (match_id, version or self.version)
+        with self._match_cache_lock:
+            entry = self._match_cache.get(memo_key)
+            if entry is not None and monotonic() - entry[0] <= self._MEMO_TTL:
+                return entry[1]
+        path = self._versioned(f"/{match_id}", version)
+        future = self.client._take_prefetched(path)
+        if future is not None:
+            result = future.result()
+        else:
+            result = self.client.get(path)
+        if isinstance(result, dict):  # awaitables from the async client skip the memo
+            with self._match_cache_lock:
+                self._match_cache[memo_key] = (monotonic(), result)
+        return result
 
     def search_matches(
         self,
@@ -86,10 +182,19 @@ class MatchesAPI(BaseAPI):
         limit: int = 20,
         offset: int = 0,
         version: Optional[str] = None,
+        adaptive: bool = False,
+        initial: int = 10,
+        cap: int = 100,
     ) -> Dict[str, Any]:
         """
         Search for matches with various filters.
 
+        With ``adaptive=True`` the explicit ``limit`` is ignored and the
+        page size starts at ``initial``, doubling after fast responses
+        and halving after slow ones (never above ``cap``), so the first
+        results arrive quickly and the backend is never asked for huge
+        pages while it is struggling.
+
         Args:
             player_id: Filter by player ID
             club_id: Filter by club ID
@@ -97,6 +202,9 @@ class MatchesAPI(BaseAPI):
             limit: Number of results to return
             offset: Pagination offset
             version: API version (default: client version)
+            adaptive: Choose the page size from recent response times
+            initial: Starting (and minimum) adaptive page size
+            cap: Hard ceiling on the adaptive page size
 
         Returns:
             List of matches
@@ -104,7 +212,8 @@ class MatchesAPI(BaseAPI):
         Example:
             >>> matches = client.matches.search_matches(player_id=12345, limit=10)
         """
-        version = version or self.version
+        if adaptive:
+            limit = self._next_adaptive_limit(initial, cap)
         search_data = {"limit": limit, "offset": offset}
 
         if player_id:
@@ -114,7 +223,81 @@ class MatchesAPI(BaseAPI):
         if event_id:
             search_data["eventId"] = event_id
 
-        return self.client.post(f"/match/{version}/search", json_data=search_data)
+        t0 = perf_counter()
+        result = self.client.post(
+            self._versioned("/search", version), json_data=search_data
+        )
+        self._last_dt = perf_counter() - t0
+        return result
+
+    def iter_matches(
+        self,
+        player_id: Optional[int] = None,
+        club_id: Optional[int] = None,
+        event_id: Optional[int] = None,
+        page_size: int = 100,
+        version: Optional[str] = None,
+        adaptive: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over matching matches one item at a time.
+
+        Pages are fetched with :meth:`search_matches`, and the next page
+        is requested on a background thread while the current page is
+        being consumed, so fetching overlaps processing and memory stays
+        bounded by one page. Iteration stops at the first short page,
+        and early exits (e.g. ``itertools.islice``) skip every page
+        beyond the lookahead already in flight. Sync client only.
+
+        Args:
+            player_id: Filter by player ID
+            club_id: Filter by club ID
+            event_id: Filter by event ID
+            page_size: Matches fetched per request; with ``adaptive``
+                this is the ceiling instead
+            version: API version (default: client version)
+            adaptive: Start with small pages and let response times
+                drive the page size (see :meth:`search_matches`), so
+                the first rows arrive fast
+
+        Yields:
+            Individual match dictionaries
+
+        Example:
+            >>> from itertools import islice
+            >>> recent = list(islice(
+            ...     client.matches.iter_matches(player_id=12345), 5
+            ... ))
+        """
+
+        def fetch(offset):
+            return self.search_matches(
+                player_id=player_id,
+                club_id=club_id,
+                event_id=event_id,
+                limit=page_size,
+                offset=offset,
+                version=version,
+                adaptive=adaptive,
+                cap=page_size,
+            )
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            offset = 0
+            future = pool.submit(fetch, offset)
+            while True:
+                page = future.result().get("result") or []
+                # With adaptive paging the worker records the limit it used
+                used_limit = self._adaptive_limit if adaptive else page_size
+                if len(page) == used_limit:
+                    # Full page - kick off the next fetch before yielding
+                    offset += used_limit
+                    future = pool.submit(fetch, offset)
+                else:
+                    future = None
+                yield from page
+                if future is None:
+                    return
 
     def save_verified_match(
         self, match_data: Dict[str, Any], version: Optional[str] = None
@@ -137,9 +320,11 @@ class MatchesAPI(BaseAPI):
             ... })
         """
         version = version or self.version
-        return self.client.put(
+        result = self.client.put(
             f"/match/verified/{version}/save", json_data=match_data
         )
+        self.client._invalidate_cache("/match/")
+        return result
 
     def delete_match(
         self, match_id: int, version: Optional[str] = None
@@ -157,8 +342,19 @@ class MatchesAPI(BaseAPI):
         Example:
             >>> client.matches.delete_match(match_id=789)
         """
-        version = version or self.version
-        return self.client.delete(f"/match/{version}/{match_id}")
+        request_raw = getattr(self.client, "_request_raw", None)
+        if request_raw is not None:
+            response = request_raw("DELETE", self._versioned(f"/{match_id}", version))
+            scalar = self._SCALAR_SUCCESS_RE.match(response.content or b"")
+            if scalar is not None:
+                result = {"success": scalar.group(1) == b"true"}
+            else:
+                result = self.client._parse_json(response)
+        else:
+            result = self.client.delete(self._versioned(f"/{match_id}", version))
+        self.client._invalidate_cache("/match/")
+        self._forget_match(match_id)
+        return result
 
     def get_match_rating_impact(
         self, match_data: Dict[str, Any], version: Optional[str] = None
@@ -250,5 +446,4 @@ class MatchesAPI(BaseAPI):
         Example:
             >>> pending = client.matches.get_pending_matches()
         """
-        version = version or self.version
-        return self.client.get(f"/match/{version}/pending")
+        return self.client.get(self._versioned("/pending", version))
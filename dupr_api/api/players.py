@@ -1,5 +1,7 @@
 """Players API endpoints."""
 
+from threading import Lock
+from time import monotonic
 from typing import Dict, Any, Optional, List
 from .base import BaseAPI
 
@@ -11,6 +13,23 @@ class PlayersAPI(BaseAPI):
     Handles player searches, ratings, and claims.
     """
 
+    _resource = "/player"
+
+    # Seconds a memoized get_player result stays valid
+    _MEMO_TTL = 30.0
+
+    def __init__(self, client):
+        super().__init__(client)
+        # Keyed by (player_id, version) so lookups against different API
+        # versions never serve each other's bodies
+        self._player_cache: Dict[tuple, Any] = {}
+        self._player_cache_lock = Lock()
+
+    def clear_cache(self):
+        """Forget all memoized get_player results."""
+        with self._player_cache_lock:
+            self._player_cache.clear()
+
     def search_players(
         self,
         query: Optional[str] = None,
@@ -38,8 +57,6 @@ class PlayersAPI(BaseAPI):
             ...     limit=10
             ... )
         """
-        version = version or self.version
-
         # DUPR API has max limit of 25 for search
         if limit > 25:
             limit = 25
@@ -52,7 +69,17 @@ class PlayersAPI(BaseAPI):
             "filter": {}  # Empty filter, using query instead
         }
 
-        return self.client.post(f"/player/{version}/search", json_data=search_data)
+        result = self.client.post(
+            self._versioned("/search", version), json_data=search_data
+        )
+        # The top hit is usually fetched next, so warm it in the background
+        hits = result.get("result") if isinstance(result, dict) else None
+        if isinstance(hits, list) and hits and isinstance(hits[0], dict):
+            player_id = hits[0].get("playerId")
+            if player_id is not None:
+                path = self._versioned(f"/{player_id}", version)
+                self.client._prefetch(path, lambda: self.client.get(path))
+        return result
 
     def get_player(self, player_id: int, version: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -65,12 +92,28 @@ class PlayersAPI(BaseAPI):
         Returns:
             Player details including rating, history, etc.
 
+        Repeat lookups of the same player within 30 seconds are served
+        from a per-namespace memo instead of the network.
+
         Example:
             >>> player = client.players.get_player(player_id=12345)
             >>> print(player['result']['rating'])
         """
-        version = version or self.version
-        return self.client.get(f"/player/{version}/{player_id}")
+        memo_key = (player_id, version or self.version)
+        with self._player_cache_lock:
+            entry = self._player_cache.get(memo_key)
+            if entry is not None and monotonic() - entry[0] <= self._MEMO_TTL:
+                return entry[1]
+        path = self._versioned(f"/{player_id}", version)
+        future = self.client._take_prefetched(path)
+        if future is not None:
+            result = future.result()
+        else:
+            result = self.client.get(path)
+        if isinstance(result, dict):  # awaitables from the async client skip the memo
+            with self._player_cache_lock:
+                self._player_cache[memo_key] = (monotonic(), result)
+        return result
 
     def get_player_rating_history(
         self,
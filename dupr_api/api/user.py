@@ -11,6 +11,8 @@ class UserAPI(BaseAPI):
     Handles user profile, settings, and preferences management.
     """
 
+    _resource = "/user"
+
     def get_profile(self, version: Optional[str] = None) -> Dict[str, Any]:
         """
         Get the current user's profile.
@@ -25,8 +27,7 @@ class UserAPI(BaseAPI):
             >>> profile = client.user.get_profile()
             >>> print(profile['result']['fullName'])
         """
-        version = version or self.version
-        return self.client.get(f"/user/{version}/profile")
+        return self.client.get(self._versioned("/profile", version))
 
     def update_profile(
         self, profile_data: Dict[str, Any], version: Optional[str] = None
@@ -47,8 +48,11 @@ class UserAPI(BaseAPI):
             ...     "location": "New York, NY"
             ... })
         """
-        version = version or self.version
-        return self.client.put(f"/user/{version}/profile", json_data=profile_data)
+        result = self.client.put(
+            self._versioned("/profile", version), json_data=profile_data
+        )
+        self.client._invalidate_cache("/user/")
+        return result
 
     def get_settings(self, version: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -63,8 +67,7 @@ class UserAPI(BaseAPI):
         Example:
             >>> settings = client.user.get_settings()
         """
-        version = version or self.version
-        return self.client.get(f"/user/{version}/settings")
+        return self.client.get(self._versioned("/settings", version))
 
     def update_settings(
         self, settings: Dict[str, Any], version: Optional[str] = None
@@ -85,8 +88,11 @@ class UserAPI(BaseAPI):
             ...     "privacyMode": "public"
             ... })
         """
-        version = version or self.version
-        return self.client.put(f"/user/{version}/settings", json_data=settings)
+        result = self.client.put(
+            self._versioned("/settings", version), json_data=settings
+        )
+        self.client._invalidate_cache("/user/")
+        return result
 
     def update_preferences(
         self, preferences: Dict[str, Any], version: Optional[str] = None
@@ -107,8 +113,11 @@ class UserAPI(BaseAPI):
             ...     "skillLevel": "intermediate"
             ... })
         """
-        version = version or self.version
-        return self.client.put(f"/user/{version}/preferences", json_data=preferences)
+        result = self.client.put(
+            self._versioned("/preferences", version), json_data=preferences
+        )
+        self.client._invalidate_cache("/user/")
+        return result
 
     def get_activities(
         self,
@@ -0,0 +1,208 @@
+"""
+Async DUPR API client implementation built on httpx.
+"""
+
+from typing import Optional, Dict, Any
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from .exceptions import DUPRAPIError
+from .client import _raise_for_status
+from .api.user import UserAPI
+from .api.matches import MatchesAPI
+from .api.clubs import ClubsAPI
+from .api.events import EventsAPI
+from .api.brackets import BracketsAPI
+from .api.admin import AdminAPI
+from .api.players import PlayersAPI
+
+
+class AsyncDUPRClient:
+    """
+    Async client for interacting with the DUPR API.
+
+    Mirrors :class:`DUPRClient` but issues requests through
+    ``httpx.AsyncClient``, so independent calls can be overlapped with
+    ``asyncio.gather`` instead of waiting on each round-trip in turn.
+    The API namespaces (``user``, ``matches``, ...) are shared with the
+    sync client; when attached to an async client their methods return
+    awaitables.
+
+    Requires the optional ``httpx`` dependency
+    (``pip install dupr-api-client[async]``).
+
+    Args:
+        bearer_token: Optional bearer token for authentication
+        base_url: Base URL for the API (default: https://backend.mydupr.com)
+        version: API version (default: v1.0)
+        timeout: Request timeout in seconds (default: 30)
+        http2: Enable HTTP/2 transport (requires the ``h2`` package)
+
+    Example:
+        >>> async with AsyncDUPRClient(bearer_token="your_token") as client:
+        ...     profile, settings = await asyncio.gather(
+        ...         client.user.get_profile(),
+        ...         client.user.get_settings(),
+        ...     )
+    """
+
+    def __init__(
+        self,
+        bearer_token: Optional[str] = None,
+        base_url: str = "https://backend.mydupr.com",
+        version: str = "v1.0",
+        timeout: int = 30,
+        http2: bool = False,
+    ):
+        if httpx is None:
+            raise ImportError(
+                "httpx is required for AsyncDUPRClient. "
+                "Install it with: pip install dupr-api-client[async]"
+            )
+
+        self.bearer_token = bearer_token
+        self.base_url = base_url.rstrip("/")
+        self.version = version
+        self.timeout = timeout
+        self.cache = None  # response caching is sync-client only
+        self.prefetch = False  # speculative prefetch is sync-client only
+        # Content-Type is not pinned on the client: httpx sets the right
+        # value per body (application/json for json=, the multipart
+        # boundary for files=), and a client-level header would override
+        # the boundary on uploads
+        transport_headers = self._get_headers()
+        transport_headers.pop("Content-Type", None)
+        self.session = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=transport_headers,
+            timeout=timeout,
+            http2=http2,
+        )
+
+        # Initialize API namespaces
+        self.user = UserAPI(self)
+        self.matches = MatchesAPI(self)
+        self.clubs = ClubsAPI(self)
+        self.events = EventsAPI(self)
+        self.brackets = BracketsAPI(self)
+        self.admin = AdminAPI(self)
+        self.players = PlayersAPI(self)
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Get request headers including authentication."""
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        if self.bearer_token:
+            headers["Authorization"] = f"Bearer {self.bearer_token}"
+        return headers
+
+    async def _make_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Make an async HTTP request to the DUPR API.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            path: API endpoint path
+            params: Query parameters
+            json_data: JSON request body
+            files: Files for multipart upload
+            **kwargs: Additional arguments to pass to httpx
+
+        Returns:
+            Response data as dictionary
+
+        Raises:
+            AuthenticationError: If authentication fails (401)
+            ValidationError: If request validation fails (400)
+            NotFoundError: If resource not found (404)
+            RateLimitError: If rate limit exceeded (429)
+            ServerError: If server error occurs (5xx)
+            DUPRAPIError: For other API errors
+        """
+        url = f"{self.base_url}{path}"
+
+        try:
+            response = await self.session.request(
+                method=method,
+                url=path,
+                params=params,
+                json=json_data,
+                files=files,
+                **kwargs,
+            )
+
+            _raise_for_status(response, url)
+
+            # Parse JSON response (orjson decodes the raw bytes directly,
+            # skipping the text-decode step of response.json())
+            if response.content:
+                if orjson is not None:
+                    return orjson.loads(response.content)
+                return response.json()
+            return {}
+
+        except httpx.TimeoutException:
+            raise DUPRAPIError(f"Request timeout after {self.timeout} seconds")
+        except httpx.ConnectError as e:
+            raise DUPRAPIError(f"Connection error: {str(e)}")
+        except httpx.HTTPError as e:
+            raise DUPRAPIError(f"Request error: {str(e)}")
+
+    def _invalidate_cache(self, prefix: str):
+        """No-op; response caching is only supported on the sync client."""
+
+    def _prefetch(self, path: str, call):
+        """No-op; speculative prefetch is only supported on the sync client."""
+
+    def _take_prefetched(self, path: str):
+        """No-op; speculative prefetch is only supported on the sync client."""
+        return None
+
+    async def get(self, path: str, **kwargs) -> Dict[str, Any]:
+        """Make a GET request."""
+        return await self._make_request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs) -> Dict[str, Any]:
+        """Make a POST request."""
+        return await self._make_request("POST", path, **kwargs)
+
+    async def put(self, path: str, **kwargs) -> Dict[str, Any]:
+        """Make a PUT request."""
+        return await self._make_request("PUT", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs) -> Dict[str, Any]:
+        """Make a DELETE request."""
+        return await self._make_request("DELETE", path, **kwargs)
+
+    def set_bearer_token(self, token: str):
+        """Set or update the bearer token for authentication."""
+        self.bearer_token = token
+        self.session.headers["Authorization"] = f"Bearer {token}"
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "AsyncDUPRClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
@@ -2,8 +2,26 @@
 Main DUPR API client implementation.
 """
 
+import json
+
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter, Retry
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from ._cache import TTLCache
 from .exceptions import (
     DUPRAPIError,
     AuthenticationError,
@@ -20,6 +38,59 @@ from .api.brackets import BracketsAPI
 from .api.admin import AdminAPI
 from .api.players import PlayersAPI
 
+# Exception families for whichever transport is in use
+_TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+_CONNECTION_ERRORS = (requests.exceptions.ConnectionError,)
+_REQUEST_ERRORS = (requests.exceptions.RequestException,)
+if httpx is not None:
+    _TIMEOUT_ERRORS += (httpx.TimeoutException,)
+    _CONNECTION_ERRORS += (httpx.ConnectError,)
+    _REQUEST_ERRORS += (httpx.HTTPError,)
+
+
+def _raise_for_status(response, url: str):
+    """Map error status codes to client exceptions.
+
+    Shared by the sync and async clients; ``response`` only needs
+    ``status_code`` and ``text`` attributes.
+    """
+    if response.status_code == 401:
+        raise AuthenticationError(
+            "Authentication failed. Please check your bearer token.",
+            status_code=401,
+            response=response,
+        )
+    elif response.status_code == 400:
+        raise ValidationError(
+            f"Validation error: {response.text}",
+            status_code=400,
+            response=response,
+        )
+    elif response.status_code == 404:
+        raise NotFoundError(
+            f"Resource not found: {url}",
+            status_code=404,
+            response=response,
+        )
+    elif response.status_code == 429:
+        raise RateLimitError(
+            "Rate limit exceeded. Please try again later.",
+            status_code=429,
+            response=response,
+        )
+    elif response.status_code >= 500:
+        raise ServerError(
+            f"Server error: {response.status_code}",
+            status_code=response.status_code,
+            response=response,
+        )
+    elif response.status_code >= 400:
+        raise DUPRAPIError(
+            f"API error: {response.status_code} - {response.text}",
+            status_code=response.status_code,
+            response=response,
+        )
+
 
 class DUPRClient:
     """
@@ -30,6 +101,26 @@ class DUPRClient:
         base_url: Base URL for the API (default: https://backend.mydupr.com)
         version: API version (default: v1.0)
         timeout: Request timeout in seconds (default: 30)
+        http2: Use an httpx HTTP/2 transport instead of requests, so
+            concurrent requests share one multiplexed connection
+            (requires ``pip install dupr-api-client[http2]``)
+        cache: Optional :class:`TTLCache` for idempotent GET responses;
+            repeated reads within the TTL skip the network, and mutating
+            endpoints purge the affected path prefix
+        pool_size: Connection pool size for the requests transport
+            (default: 32); keep-alive connections are reused across
+            endpoints instead of re-doing the TCP+TLS handshake
+        prefetch: Speculatively fetch likely follow-up resources on a
+            background thread (e.g. the match just saved), hiding the
+            follow-up latency when the guess is right
+        warmup: Issue a cheap HEAD request in the background at
+            construction to prime a keep-alive connection, removing the
+            TCP+TLS handshake from the first real call; leave off in
+            tests so mocked transports see no extra request
+        compact_json: Serialize request bodies with a prebuilt compact
+            encoder (no separators whitespace, non-ASCII unescaped, or
+            orjson when installed) instead of requests' per-call
+            json.dumps, shrinking payloads and serialization time
 
     Example:
         >>> client = DUPRClient(bearer_token="your_token")
@@ -43,12 +134,87 @@ class DUPRClient:
         base_url: str = "https://backend.mydupr.com",
         version: str = "v1.0",
         timeout: int = 30,
+        http2: bool = False,
+        cache: Optional[TTLCache] = None,
+        pool_size: int = 32,
+        prefetch: bool = False,
+        warmup: bool = False,
+        compact_json: bool = False,
     ):
         self.bearer_token = bearer_token
         self.base_url = base_url.rstrip("/")
         self.version = version
         self.timeout = timeout
-        self.session = requests.Session()
+        self.http2 = http2
+        self.cache = cache
+        self.prefetch = prefetch
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+        self._prefetch_futures: Dict[str, Future] = {}
+        self._prefetch_lock = Lock()
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = Lock()
+
+        # Build the headers once; they are attached to the session so
+        # requests don't rebuild the dict per call
+        self._headers = dict(self._build_headers(bearer_token))
+
+        # Prebuilt request-body encoder: orjson already emits compact
+        # bytes, the stdlib encoder is configured once instead of per call
+        self.compact_json = compact_json
+        if orjson is not None:
+            self._encode = orjson.dumps
+        else:
+            _encode_str = json.JSONEncoder(
+                separators=(",", ":"), ensure_ascii=False
+            ).encode
+            self._encode = lambda obj: _encode_str(obj).encode("utf-8")
+
+        if http2:
+            if httpx is None:
+                raise ImportError(
+                    "httpx is required for HTTP/2 support. "
+                    "Install it with: pip install dupr-api-client[http2]"
+                )
+            # Content-Type is not pinned on the httpx client: httpx sets
+            # the right value per body (application/json for json=, the
+            # multipart boundary for files=), and a client-level header
+            # would override the boundary on uploads
+            transport_headers = {
+                k: v for k, v in self._headers.items() if k != "Content-Type"
+            }
+            self.session = httpx.Client(
+                base_url=self.base_url,
+                headers=transport_headers,
+                timeout=timeout,
+                http2=True,
+            )
+        else:
+            self.session = requests.Session()
+            # Size the pool for many concurrent endpoints and retry
+            # transient failures; raise_on_status stays off so exhausted
+            # retries still surface through the usual status handling
+            # Reads only: this API creates resources via PUT (save_match,
+            # add_club), so re-sending one after a 5xx could double-create
+            # data the server already persisted
+            retry = Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "HEAD", "OPTIONS"],
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=pool_size,
+                pool_maxsize=pool_size * 2,
+                max_retries=retry,
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            self.session.headers.update(self._headers)
+
+        self._warmup_future: Optional[Future] = None
+        if warmup:
+            self._warmup_future = self._get_prefetch_pool().submit(self._warm_up)
 
         # Initialize API namespaces
         self.user = UserAPI(self)
@@ -59,17 +225,29 @@ class DUPRClient:
         self.admin = AdminAPI(self)
         self.players = PlayersAPI(self)
 
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _build_headers(token: Optional[str]) -> tuple:
+        """
+        Build the base headers for a token as an immutable tuple.
+
+        Cached per token, so repeated client construction and token
+        flips reuse the same tuple (and 'Bearer ' concatenation)
+        instead of rebuilding it.
+        """
+        headers = (
+            ("Content-Type", "application/json"),
+            ("Accept", "application/json"),
+        )
+        if token:
+            headers += (("Authorization", f"Bearer {token}"),)
+        return headers
+
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers including authentication."""
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-        if self.bearer_token:
-            headers["Authorization"] = f"Bearer {self.bearer_token}"
-        return headers
+        return self._headers.copy()
 
-    def _make_request(
+    def _request_raw(
         self,
         method: str,
         path: str,
@@ -77,9 +255,13 @@ class DUPRClient:
         json_data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
         **kwargs,
-    ) -> Dict[str, Any]:
+    ):
         """
-        Make an HTTP request to the DUPR API.
+        Send an HTTP request and return the unparsed response.
+
+        Status codes are mapped to client exceptions, but the body is
+        left as raw bytes so hot paths with tiny fixed-shape envelopes
+        can scan ``response.content`` instead of building a dict.
 
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
@@ -90,7 +272,7 @@ class DUPRClient:
             **kwargs: Additional arguments to pass to requests
 
         Returns:
-            Response data as dictionary
+            The transport response object
 
         Raises:
             AuthenticationError: If authentication fails (401)
@@ -101,77 +283,139 @@ class DUPRClient:
             DUPRAPIError: For other API errors
         """
         url = f"{self.base_url}{path}"
-        headers = self._get_headers()
 
-        # Remove Content-Type for file uploads
-        if files:
-            headers.pop("Content-Type", None)
+        # Headers live on the session; only file uploads need a per-call
+        # override. requests merges session and request headers and drops
+        # any key whose per-request value is None, which lets the
+        # multipart boundary replace the session's JSON Content-Type
+        # (the httpx client never pins Content-Type, see __init__)
+        headers = None
+        if files and not self.http2:
+            headers = {"Content-Type": None}
+
+        request_kwargs = dict(
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            files=files,
+            timeout=self.timeout,
+            **kwargs,
+        )
+        if self.compact_json and json_data is not None and not files:
+            encoded = self._encode(json_data)
+            # httpx takes raw bodies via content=, requests via data=;
+            # raw content carries no implied type, so label it for the
+            # httpx client (the requests session header still applies)
+            if self.http2:
+                request_kwargs["content"] = encoded
+                request_kwargs["headers"] = {"Content-Type": "application/json"}
+            else:
+                request_kwargs["data"] = encoded
+        else:
+            request_kwargs["json"] = json_data
 
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params,
-                json=json_data,
-                files=files,
-                timeout=self.timeout,
-                **kwargs,
-            )
+            response = self.session.request(**request_kwargs)
 
             # Handle different status codes
-            if response.status_code == 401:
-                raise AuthenticationError(
-                    "Authentication failed. Please check your bearer token.",
-                    status_code=401,
-                    response=response,
-                )
-            elif response.status_code == 400:
-                raise ValidationError(
-                    f"Validation error: {response.text}",
-                    status_code=400,
-                    response=response,
-                )
-            elif response.status_code == 404:
-                raise NotFoundError(
-                    f"Resource not found: {url}",
-                    status_code=404,
-                    response=response,
-                )
-            elif response.status_code == 429:
-                raise RateLimitError(
-                    "Rate limit exceeded. Please try again later.",
-                    status_code=429,
-                    response=response,
-                )
-            elif response.status_code >= 500:
-                raise ServerError(
-                    f"Server error: {response.status_code}",
-                    status_code=response.status_code,
-                    response=response,
-                )
-            elif response.status_code >= 400:
-                raise DUPRAPIError(
-                    f"API error: {response.status_code} - {response.text}",
-                    status_code=response.status_code,
-                    response=response,
-                )
-
-            # Parse JSON response
-            if response.content:
-                return response.json()
-            return {}
+            _raise_for_status(response, url)
+            return response
 
-        except requests.exceptions.Timeout:
+        except _TIMEOUT_ERRORS:
             raise DUPRAPIError(f"Request timeout after {self.timeout} seconds")
-        except requests.exceptions.ConnectionError as e:
+        except _CONNECTION_ERRORS as e:
             raise DUPRAPIError(f"Connection error: {str(e)}")
-        except requests.exceptions.RequestException as e:
+        except _REQUEST_ERRORS as e:
             raise DUPRAPIError(f"Request error: {str(e)}")
 
+    @staticmethod
+    def _parse_json(response) -> Dict[str, Any]:
+        """Parse a response body (orjson decodes the raw bytes directly,
+        skipping the text-decode step of response.json())."""
+        if response.content:
+            if orjson is not None:
+                return orjson.loads(response.content)
+            return response.json()
+        return {}
+
+    def _make_request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        """Make an HTTP request and parse the JSON body (see
+        :meth:`_request_raw` for arguments and raised exceptions)."""
+        return self._parse_json(self._request_raw(method, path, **kwargs))
+
+    def _warm_up(self):
+        """Prime one keep-alive connection; never let warmup errors surface."""
+        try:
+            self.session.head(self.base_url, timeout=self.timeout)
+        except Exception:
+            pass
+
+    def _get_prefetch_pool(self) -> ThreadPoolExecutor:
+        """Lazily create the background pool for speculative requests."""
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(max_workers=4)
+        return self._prefetch_pool
+
+    def _prefetch(self, path: str, call: Callable[[], Any]):
+        """Speculatively run ``call`` on a background thread, keyed by path."""
+        if not self.prefetch:
+            return
+        with self._prefetch_lock:
+            if path in self._prefetch_futures:
+                return
+            self._prefetch_futures[path] = self._get_prefetch_pool().submit(call)
+
+    def _take_prefetched(self, path: str) -> Optional[Future]:
+        """Return and consume the in-flight prefetch for ``path``, if any."""
+        with self._prefetch_lock:
+            return self._prefetch_futures.pop(path, None)
+
+    def _invalidate_cache(self, prefix: str):
+        """Purge cached GET responses under ``prefix`` after a write."""
+        if self.cache is not None:
+            self.cache.invalidate(prefix)
+
     def get(self, path: str, **kwargs) -> Dict[str, Any]:
-        """Make a GET request."""
-        return self._make_request("GET", path, **kwargs)
+        """
+        Make a GET request.
+
+        Identical concurrent GETs are coalesced: the first caller owns
+        the HTTP round-trip and later callers block on its Future and
+        share the parsed result, so fan-in workloads (e.g. several UI
+        components rendering the same match) cost one request instead
+        of N. Only applied to GET, which is idempotent.
+        """
+        params = kwargs.get("params")
+        key = ("GET", path, tuple(sorted(params.items())) if params else ())
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                owner = False
+            else:
+                owner = True
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            result = self._make_request("GET", path, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            if self.cache is not None:
+                self.cache.set(key, result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
 
     def post(self, path: str, **kwargs) -> Dict[str, Any]:
         """Make a POST request."""
@@ -185,6 +429,74 @@ class DUPRClient:
         """Make a DELETE request."""
         return self._make_request("DELETE", path, **kwargs)
 
+    def batch(self, calls: List[Callable[[], Any]]) -> List[Any]:
+        """
+        Run independent API calls concurrently.
+
+        The calls are dispatched on a thread pool, so K independent
+        round-trips take roughly as long as the slowest one instead of
+        their sum. The workload is I/O-bound, so the GIL is released
+        while each thread waits on its socket. For more than ~10
+        concurrent calls, prefer :class:`AsyncDUPRClient` with
+        ``asyncio.gather``.
+
+        Args:
+            calls: Zero-argument callables, each performing one API call
+
+        Returns:
+            The call results, in the same order as ``calls``
+
+        Example:
+            >>> profile, settings = client.batch([
+            ...     lambda: client.user.get_profile(),
+            ...     lambda: client.user.get_settings(),
+            ... ])
+        """
+        if not calls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(32, len(calls))) as pool:
+            return list(pool.map(lambda call: call(), calls))
+
     def set_bearer_token(self, token: str):
         """Set or update the bearer token for authentication."""
         self.bearer_token = token
+        self._headers = dict(self._build_headers(token))
+        # Only Authorization changes on the live session; pushing the
+        # full dict would re-pin Content-Type on the httpx client, which
+        # __init__ deliberately leaves unset so uploads keep their
+        # multipart boundary
+        self.session.headers["Authorization"] = f"Bearer {token}"
+
+
+# Process-wide shared clients keyed by (bearer_token, base_url)
+_DEFAULT_CLIENTS: Dict[tuple, DUPRClient] = {}
+_DEFAULT_CLIENTS_LOCK = Lock()
+
+
+def get_default_client(
+    bearer_token: Optional[str] = None,
+    base_url: str = "https://backend.mydupr.com",
+) -> DUPRClient:
+    """
+    Return a process-wide shared client for the given token and URL.
+
+    Lazily creates one :class:`DUPRClient` per (bearer_token, base_url)
+    pair and reuses it on later calls, so scripts composed in the same
+    process share a connection pool, prebuilt headers, and caches
+    instead of each warming up their own. Thread-safe.
+
+    Args:
+        bearer_token: Optional bearer token for authentication
+        base_url: Base URL for the API (default: https://backend.mydupr.com)
+
+    Example:
+        >>> client = get_default_client(bearer_token="your_token")
+    """
+    key = (bearer_token, base_url)
+    with _DEFAULT_CLIENTS_LOCK:
+        client = _DEFAULT_CLIENTS.get(key)
+        if client is None:
+            client = _DEFAULT_CLIENTS[key] = DUPRClient(
+                bearer_token=bearer_token, base_url=base_url
+            )
+    return client
@@ -0,0 +1,47 @@
+"""
+Async usage examples for DUPR API client.
+
+Requires the optional httpx dependency:
+    pip install dupr-api-client[async]
+"""
+
+import asyncio
+
+from dupr_api import AsyncDUPRClient
+from dupr_api.exceptions import AuthenticationError, DUPRAPIError
+
+
+async def main():
+    """Demonstrate concurrent requests with the async client."""
+
+    # Initialize the client with your bearer token
+    # In production, store your token securely (e.g., environment variable)
+    bearer_token = "your_bearer_token_here"
+
+    async with AsyncDUPRClient(bearer_token=bearer_token) as client:
+        try:
+            # The three calls below are independent, so run them
+            # concurrently instead of waiting on each in turn
+            print("Fetching profile, settings, and players concurrently...")
+            profile, settings, players = await asyncio.gather(
+                client.user.get_profile(),
+                client.user.get_settings(),
+                client.players.search_players(query="John", limit=5),
+            )
+
+            user_data = profile['result']
+            print(f"User: {user_data.get('fullName', 'N/A')}")
+            print(f"Settings: {settings['result']}")
+
+            print(f"\nFound {len(players.get('result', []))} players")
+            for player in players.get('result', [])[:3]:
+                print(f"  - {player.get('fullName')} (Rating: {player.get('rating', 'N/A')})")
+
+        except AuthenticationError:
+            print("Authentication failed. Please check your bearer token.")
+        except DUPRAPIError as e:
+            print(f"API Error: {e.message}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
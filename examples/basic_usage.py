@@ -2,16 +2,17 @@
 Basic usage examples for DUPR API client.
 """
 
-from dupr_api import DUPRClient
+from dupr_api import get_default_client
 from dupr_api.exceptions import AuthenticationError, DUPRAPIError
 
 def main():
     """Demonstrate basic client usage."""
 
-    # Initialize the client with your bearer token
+    # Grab the shared client for this token so composed scripts reuse
+    # one connection pool instead of each building their own
     # In production, store your token securely (e.g., environment variable)
     bearer_token = "your_bearer_token_here"
-    client = DUPRClient(bearer_token=bearer_token)
+    client = get_default_client(bearer_token=bearer_token)
 
     try:
         # Get user profile
@@ -2,7 +2,9 @@
 Match management examples for DUPR API client.
 """
 
-from dupr_api import DUPRClient
+from itertools import islice
+
+from dupr_api import get_default_client
 from dupr_api.exceptions import DUPRAPIError
 
 
@@ -83,15 +85,14 @@ def search_player_matches(client, player_id):
     print(f"\nSearching matches for player {player_id}...")
 
     try:
-        matches = client.matches.search_matches(
-            player_id=player_id,
-            limit=10,
-            offset=0
-        )
-        match_list = matches.get('result', [])
-        print(f"Found {len(match_list)} matches")
-
-        for match in match_list[:5]:
+        # iter_matches pages lazily, so slicing off five matches skips
+        # every page beyond the lookahead already in flight
+        match_list = list(islice(
+            client.matches.iter_matches(player_id=player_id, page_size=10), 5
+        ))
+        print(f"Showing {len(match_list)} matches")
+
+        for match in match_list:
             print(f"  Match ID: {match.get('matchId')}, "
                   f"Format: {match.get('format')}, "
                   f"Date: {match.get('matchDate', 'N/A')}")
@@ -124,22 +125,21 @@ def simulate_rating_impact(client):
 def main():
     """Run match management examples."""
     bearer_token = "your_bearer_token_here"
-    client = DUPRClient(bearer_token=bearer_token)
+    client = get_default_client(bearer_token=bearer_token)
 
-    # Create matches
-    singles_match_id = create_singles_match(client)
-    doubles_match_id = create_doubles_match(client)
+    # Create matches, search, and simulate concurrently - the four
+    # calls are independent, so batch() overlaps their round-trips
+    singles_match_id, doubles_match_id, _, _ = client.batch([
+        lambda: create_singles_match(client),
+        lambda: create_doubles_match(client),
+        lambda: search_player_matches(client, player_id=12345),
+        lambda: simulate_rating_impact(client),
+    ])
 
     # Get match details
     if singles_match_id:
         get_match_details(client, singles_match_id)
 
-    # Search player matches
-    search_player_matches(client, player_id=12345)
-
-    # Simulate rating impact
-    simulate_rating_impact(client)
-
 
 if __name__ == "__main__":
     main()
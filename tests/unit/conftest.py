@@ -0,0 +1,94 @@
+"""Shared fixtures for unit tests."""
+
+import json
+
+import pytest
+from unittest.mock import patch
+
+# Resolved lazily by _session_class() so patch.object skips the
+# dotted-path parse that patch("dupr_api.client.requests.Session.request")
+# repeats for every test, without importing the client package (and
+# requests) at collection time
+_SESSION = None
+
+
+def _session_class():
+    global _SESSION
+    if _SESSION is None:
+        import dupr_api.client as _client_mod
+
+        _SESSION = _client_mod.requests.Session
+    return _SESSION
+
+
+class FakeResponse:
+    """Minimal response object for mocked transports.
+
+    The code under test only touches ``status_code``, ``content``,
+    ``text`` and ``json()``, so a slotted class is far cheaper to build
+    than a ``Mock`` (no child mocks, no call recording, no per-instance
+    ``__dict__``).
+    """
+
+    __slots__ = ("status_code", "content", "text", "_payload")
+
+    def __init__(self, payload=None, status=200, text=""):
+        self.status_code = status
+        self.text = text
+        if payload is None:
+            self.content = b""
+            self._payload = {}
+        else:
+            self.content = json.dumps(payload).encode("utf-8")
+            self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+@pytest.fixture(autouse=True)
+def mock_request():
+    """Patch Session.request once per test and share the Mock.
+
+    Installed autouse so the unit tests stop re-entering
+    unittest.mock.patch per method; each test configures the yielded
+    mock (it defaults to an empty 200). Tests that never touch the
+    network simply ignore it.
+    """
+    with patch.object(_session_class(), "request") as mock:
+        mock.return_value = FakeResponse()
+        yield mock
+
+
+class FakeSession:
+    """Minimal in-process stand-in for ``requests.Session``.
+
+    Returns a canned response and records the last call's kwargs, so
+    tests can drive a client with no real transport and no mock
+    machinery at all: assign it to ``client.session``.
+    """
+
+    def __init__(self, response):
+        self.headers = {}
+        self.response = response
+        self.last_call = None
+
+    def request(self, **kwargs):
+        self.last_call = kwargs
+        return self.response
+
+
+@pytest.fixture
+def fake_session():
+    """Factory for a FakeSession transport stub around a canned response."""
+    return FakeSession
+
+
+@pytest.fixture
+def make_response():
+    """Build a canned response for Session.request mocks.
+
+    The payload is serialized into ``content`` so both the orjson and
+    the ``response.json()`` parse paths see the same data.
+    """
+    return FakeResponse
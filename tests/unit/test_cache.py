@@ -0,0 +1,87 @@
+"""Unit tests for response caching."""
+
+import pytest
+from dupr_api import DUPRClient, TTLCache
+
+
+class TestTTLCache:
+    """Test suite for the TTLCache class."""
+
+    def test_get_and_set(self):
+        """Test basic cache storage and retrieval."""
+        cache = TTLCache()
+        key = ("GET", "/user/v1.0/profile", ())
+
+        assert cache.get(key) is None
+        cache.set(key, {"result": {}})
+        assert cache.get(key) == {"result": {}}
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after the TTL."""
+        cache = TTLCache(ttl=0)
+        key = ("GET", "/user/v1.0/profile", ())
+
+        cache.set(key, {"result": {}})
+        assert cache.get(key) is None
+
+    def test_lru_eviction(self):
+        """Test that the oldest entry is evicted at maxsize."""
+        cache = TTLCache(maxsize=2)
+        cache.set(("GET", "/a", ()), 1)
+        cache.set(("GET", "/b", ()), 2)
+        cache.set(("GET", "/c", ()), 3)
+
+        assert len(cache) == 2
+        assert cache.get(("GET", "/a", ())) is None
+        assert cache.get(("GET", "/c", ())) == 3
+
+    def test_invalidate_prefix(self):
+        """Test prefix-based invalidation."""
+        cache = TTLCache()
+        cache.set(("GET", "/user/v1.0/profile", ()), {"result": {}})
+        cache.set(("GET", "/match/v1.0/789", ()), {"result": {}})
+
+        cache.invalidate("/user/")
+
+        assert cache.get(("GET", "/user/v1.0/profile", ())) is None
+        assert cache.get(("GET", "/match/v1.0/789", ())) is not None
+
+
+class TestClientCaching:
+    """Test suite for DUPRClient GET caching."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a test client with caching enabled."""
+        return DUPRClient(bearer_token="test_token", cache=TTLCache())
+
+    def test_repeated_get_served_from_cache(self, mock_request, client, make_response):
+        """Test that a repeated GET skips the network."""
+        mock_request.return_value = make_response({"result": {"userId": 12345}})
+
+        first = client.user.get_profile()
+        second = client.user.get_profile()
+
+        assert first == second
+        assert mock_request.call_count == 1
+
+    def test_write_invalidates_cached_reads(self, mock_request, client, make_response):
+        """Test that a mutating call purges the affected prefix."""
+        mock_request.return_value = make_response({"result": {}})
+
+        client.user.get_profile()
+        client.user.update_profile({"fullName": "John Updated"})
+        client.user.get_profile()
+
+        # GET, PUT, then a fresh GET - the cached profile was purged
+        assert mock_request.call_count == 3
+
+    def test_cache_disabled_by_default(self, mock_request, make_response):
+        """Test that clients without a cache always hit the network."""
+        mock_request.return_value = make_response({"result": {}})
+
+        client = DUPRClient(bearer_token="test_token")
+        client.user.get_profile()
+        client.user.get_profile()
+
+        assert mock_request.call_count == 2
@@ -2,8 +2,7 @@
 
 import pytest
 import requests
-from unittest.mock import Mock, patch, MagicMock
-from dupr_api import DUPRClient
+from dupr_api import DUPRClient, get_default_client
 from dupr_api.exceptions import (
     AuthenticationError,
     ValidationError,
@@ -41,6 +40,38 @@ class TestDUPRClient:
         assert client.version == "v2.0"
         assert client.timeout == 60
 
+    def test_connection_pool_configuration(self):
+        """Test pool sizing and retry policy on the mounted adapter."""
+        client = DUPRClient(bearer_token="test_token", pool_size=8)
+        adapter = client.session.get_adapter("https://backend.mydupr.com")
+
+        assert adapter._pool_connections == 8
+        assert adapter._pool_maxsize == 16
+        assert adapter.max_retries.total == 3
+        assert 429 in adapter.max_retries.status_forcelist
+        # Writes are never retried - a replayed PUT could double-create
+        assert "PUT" not in adapter.max_retries.allowed_methods
+        assert "GET" in adapter.max_retries.allowed_methods
+
+    def test_client_http2_transport(self):
+        """Test opting in to the httpx HTTP/2 transport."""
+        httpx = pytest.importorskip("httpx")
+
+        client = DUPRClient(bearer_token="test_token", http2=True)
+
+        assert isinstance(client.session, httpx.Client)
+        assert not isinstance(client.session, requests.Session)
+
+    def test_warmup_primes_connection(self, mock_request, make_response):
+        """Test that warmup issues a background HEAD at construction."""
+        mock_request.return_value = make_response()
+
+        client = DUPRClient(bearer_token="test_token", warmup=True)
+        client._warmup_future.result()
+
+        assert mock_request.call_count == 1
+        assert mock_request.call_args.args[0] == "HEAD"
+
     def test_get_headers_with_token(self):
         """Test header generation with bearer token."""
         client = DUPRClient(bearer_token="test_token")
@@ -66,43 +97,80 @@ class TestDUPRClient:
 
         client.set_bearer_token("new_token")
         assert client.bearer_token == "new_token"
+        assert client._get_headers()["Authorization"] == "Bearer new_token"
+        assert client.session.headers["Authorization"] == "Bearer new_token"
+
+    def test_set_bearer_token_http2_keeps_content_type_unpinned(self):
+        """Test that a token change never re-pins Content-Type on httpx."""
+        pytest.importorskip("httpx")
+
+        client = DUPRClient(bearer_token="test_token", http2=True)
+        client.set_bearer_token("new_token")
 
-    @patch("dupr_api.client.requests.Session.request")
-    def test_successful_get_request(self, mock_request):
+        assert client.session.headers["Authorization"] == "Bearer new_token"
+        assert "Content-Type" not in client.session.headers
+
+    def test_successful_get_request(self, mock_request, make_response):
         """Test successful GET request."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"result": "success"}
-        mock_response.content = b'{"result": "success"}'
-        mock_request.return_value = mock_response
+        mock_request.return_value = make_response({"result": "success"})
 
         client = DUPRClient(bearer_token="test_token")
         result = client.get("/test/endpoint")
 
         assert result == {"result": "success"}
-        mock_request.assert_called_once()
+        assert mock_request.call_count == 1
 
-    @patch("dupr_api.client.requests.Session.request")
-    def test_successful_post_request(self, mock_request):
+    def test_successful_post_request(self, mock_request, make_response):
         """Test successful POST request."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"result": "created"}
-        mock_response.content = b'{"result": "created"}'
-        mock_request.return_value = mock_response
+        mock_request.return_value = make_response({"result": "created"})
 
         client = DUPRClient(bearer_token="test_token")
         result = client.post("/test/endpoint", json_data={"key": "value"})
 
         assert result == {"result": "created"}
 
-    @patch("dupr_api.client.requests.Session.request")
-    def test_authentication_error_401(self, mock_request):
+    def test_multipart_upload_drops_json_content_type(
+        self, mock_request, make_response
+    ):
+        """Test that file uploads unset the session's JSON Content-Type."""
+        mock_request.return_value = make_response({"result": "uploaded"})
+
+        client = DUPRClient(bearer_token="test_token")
+        result = client.post("/test/upload", files={"file": ("a.csv", b"data")})
+
+        assert result == {"result": "uploaded"}
+        headers = mock_request.call_args.kwargs["headers"]
+        # A None value makes requests drop the merged session header, so
+        # the multipart boundary is used instead of application/json
+        assert headers["Content-Type"] is None
+
+    def test_fake_session_transport(self, fake_session, make_response):
+        """Test driving the client through the in-process transport stub."""
+        client = DUPRClient(bearer_token="test_token")
+        session = fake_session(make_response({"result": "success"}))
+        client.session = session
+
+        result = client.get("/test/endpoint")
+
+        assert result == {"result": "success"}
+        assert session.last_call["method"] == "GET"
+        assert session.last_call["url"].endswith("/test/endpoint")
+
+    def test_compact_json_request_body(self, mock_request, make_response):
+        """Test sending a pre-encoded compact body instead of json=."""
+        mock_request.return_value = make_response({"result": "created"})
+
+        client = DUPRClient(bearer_token="test_token", compact_json=True)
+        result = client.post("/test/endpoint", json_data={"key": "value"})
+
+        assert result == {"result": "created"}
+        kwargs = mock_request.call_args.kwargs
+        assert kwargs["data"] == b'{"key":"value"}'
+        assert "json" not in kwargs
+
+    def test_authentication_error_401(self, mock_request, make_response):
         """Test 401 authentication error handling."""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.text = "Unauthorized"
-        mock_request.return_value = mock_response
+        mock_request.return_value = make_response(status=401, text="Unauthorized")
 
         client = DUPRClient(bearer_token="invalid_token")
 
@@ -111,13 +179,9 @@ class TestDUPRClient:
 
         assert exc_info.value.status_code == 401
 
-    @patch("dupr_api.client.requests.Session.request")
-    def test_validation_error_400(self, mock_request):
+    def test_validation_error_400(self, mock_request, make_response):
         """Test 400 validation error handling."""
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.text = "Bad Request"
-        mock_request.return_value = mock_response
+        mock_request.return_value = make_response(status=400, text="Bad Request")
 
         client = DUPRClient(bearer_token="test_token")
 
@@ -126,13 +190,9 @@ class TestDUPRClient:
 
         assert exc_info.value.status_code == 400
 
-    @patch("dupr_api.client.requests.Session.request")
-    def test_not_found_error_404(self, mock_request):
+    def test_not_found_error_404(self, mock_request, make_response):
         """Test 404 not found error handling."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.text = "Not Found"
-        mock_request.return_value = mock_response
+        mock_request.return_value = make_response(status=404, text="Not Found")
 
         client = DUPRClient(bearer_token="test_token")
 
@@ -141,13 +201,11 @@ class TestDUPRClient:
 
         assert exc_info.value.status_code == 404
 
-    @patch("dupr_api.client.requests.Session.request")
-    def test_rate_limit_error_429(self, mock_request):
+    def test_rate_limit_error_429(self, mock_request, make_response):
         """Test 429 rate limit error handling."""
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_response.text = "Too Many Requests"
-        mock_request.return_value = mock_response
+        mock_request.return_value = make_response(
+            status=429, text="Too Many Requests"
+        )
 
         client = DUPRClient(bearer_token="test_token")
 
@@ -156,13 +214,11 @@ class TestDUPRClient:
 
         assert exc_info.value.status_code == 429
 
-    @patch("dupr_api.client.requests.Session.request")
-    def test_server_error_500(self, mock_request):
+    def test_server_error_500(self, mock_request, make_response):
         """Test 500 server error handling."""
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
-        mock_request.return_value = mock_response
+        mock_request.return_value = make_response(
+            status=500, text="Internal Server Error"
+        )
 
         client = DUPRClient(bearer_token="test_token")
 
@@ -171,7 +227,6 @@ class TestDUPRClient:
 
         assert exc_info.value.status_code == 500
 
-    @patch("dupr_api.client.requests.Session.request")
     def test_connection_error(self, mock_request):
         """Test connection error handling."""
         mock_request.side_effect = requests.exceptions.ConnectionError("Connection failed")
@@ -183,7 +238,6 @@ class TestDUPRClient:
 
         assert "Connection error" in str(exc_info.value)
 
-    @patch("dupr_api.client.requests.Session.request")
     def test_timeout_error(self, mock_request):
         """Test timeout error handling."""
         mock_request.side_effect = requests.exceptions.Timeout("Request timeout")
@@ -195,19 +249,65 @@ class TestDUPRClient:
 
         assert "timeout" in str(exc_info.value).lower()
 
-    @patch("dupr_api.client.requests.Session.request")
-    def test_empty_response(self, mock_request):
+    def test_empty_response(self, mock_request, make_response):
         """Test handling of empty response."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b""
-        mock_request.return_value = mock_response
+        mock_request.return_value = make_response()
 
         client = DUPRClient(bearer_token="test_token")
         result = client.get("/test/endpoint")
 
         assert result == {}
 
+    def test_batch_requests(self, mock_request, make_response):
+        """Test dispatching independent calls concurrently via batch."""
+        mock_request.return_value = make_response({"result": "success"})
+
+        client = DUPRClient(bearer_token="test_token")
+        results = client.batch([
+            lambda: client.get("/test/one"),
+            lambda: client.get("/test/two"),
+            lambda: client.get("/test/three"),
+        ])
+
+        assert results == [{"result": "success"}] * 3
+        assert mock_request.call_count == 3
+
+    def test_concurrent_identical_gets_coalesced(self, mock_request, make_response):
+        """Test that overlapping identical GETs share one round-trip."""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        def slow_response(*args, **kwargs):
+            time.sleep(0.2)
+            return make_response({"result": "success"})
+
+        mock_request.side_effect = slow_response
+
+        client = DUPRClient(bearer_token="test_token")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [
+                pool.submit(client.get, "/test/endpoint") for _ in range(2)
+            ]
+            results = [f.result() for f in futures]
+
+        assert results == [{"result": "success"}] * 2
+        assert mock_request.call_count == 1
+
+    def test_batch_empty(self):
+        """Test batch with no calls."""
+        client = DUPRClient(bearer_token="test_token")
+
+        assert client.batch([]) == []
+
+    def test_get_default_client_is_shared(self):
+        """Test that the default client is memoized per token and URL."""
+        first = get_default_client(bearer_token="shared_token")
+        second = get_default_client(bearer_token="shared_token")
+        other = get_default_client(bearer_token="other_token")
+
+        assert first is second
+        assert first is not other
+
     def test_api_namespaces_initialized(self):
         """Test that all API namespaces are properly initialized."""
         client = DUPRClient(bearer_token="test_token")
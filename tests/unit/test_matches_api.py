@@ -1,7 +1,6 @@
 """Unit tests for Matches API."""
 
 import pytest
-from unittest.mock import Mock, patch
 from dupr_api import DUPRClient
 
 
@@ -13,14 +12,9 @@ class TestMatchesAPI:
         """Create a test client."""
         return DUPRClient(bearer_token="test_token")
 
-    @patch("dupr_api.client.requests.Session.request")
-    def test_save_match(self, mock_request, client):
+    def test_save_match(self, mock_request, client, make_response):
         """Test saving a new match."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"result": 12345}
-        mock_response.content = b'{"result": 12345}'
-        mock_request.return_value = mock_response
+        mock_request.return_value = make_response({"result": 12345})
 
         match_data = {
             "format": "singles",
@@ -31,47 +25,66 @@ class TestMatchesAPI:
         result = client.matches.save_match(match_data)
 
         assert result["result"] == 12345
-        mock_request.assert_called_once()
+        assert mock_request.call_count == 1
         args, kwargs = mock_request.call_args
         assert kwargs["method"] == "PUT"
         assert kwargs["json"] == match_data
         assert "/match/v1.0/save" in kwargs["url"]
 
-    @patch("dupr_api.client.requests.Session.request")
-    def test_get_match(self, mock_request, client):
+    def test_get_match(self, mock_request, client, make_response):
         """Test getting match details."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_request.return_value = make_response({
             "result": {
                 "matchId": 789,
                 "format": "doubles",
                 "status": "COMPLETED"
             }
-        }
-        mock_response.content = b'{"result": {}}'
-        mock_request.return_value = mock_response
+        })
 
         result = client.matches.get_match(match_id=789)
 
         assert result["result"]["matchId"] == 789
-        mock_request.assert_called_once()
+        assert mock_request.call_count == 1
         args, kwargs = mock_request.call_args
         assert "789" in kwargs["url"]
 
-    @patch("dupr_api.client.requests.Session.request")
-    def test_search_matches(self, mock_request, client):
+    def test_get_match_memoized(self, mock_request, client, make_response):
+        """Test that repeat get_match lookups skip the network."""
+        mock_request.return_value = make_response({"result": {"matchId": 789}})
+
+        first = client.matches.get_match(match_id=789)
+        second = client.matches.get_match(match_id=789)
+
+        assert first == second
+        assert mock_request.call_count == 1
+
+        # A different API version is a different resource, not a memo hit
+        client.matches.get_match(match_id=789, version="v2.0")
+        assert mock_request.call_count == 2
+
+        client.matches.clear_cache()
+        client.matches.get_match(match_id=789)
+        assert mock_request.call_count == 3
+
+    def test_update_match_invalidates_memo(self, mock_request, client, make_response):
+        """Test that updating a match drops its memoized entry."""
+        mock_request.return_value = make_response({"result": {"matchId": 789}})
+
+        client.matches.get_match(match_id=789)
+        client.matches.update_match({"matchId": 789, "scores": []})
+        client.matches.get_match(match_id=789)
+
+        # GET, PUT, then a fresh GET - the memoized match was dropped
+        assert mock_request.call_count == 3
+
+    def test_search_matches(self, mock_request, client, make_response):
         """Test searching for matches."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_request.return_value = make_response({
             "result": [
                 {"matchId": 1, "format": "singles"},
                 {"matchId": 2, "format": "doubles"}
             ]
-        }
-        mock_response.content = b'{"result": []}'
-        mock_request.return_value = mock_response
+        })
 
         result = client.matches.search_matches(
             player_id=12345,
@@ -80,20 +93,15 @@ class TestMatchesAPI:
         )
 
         assert len(result["result"]) == 2
-        mock_request.assert_called_once()
+        assert mock_request.call_count == 1
         args, kwargs = mock_request.call_args
         assert kwargs["method"] == "POST"
         assert kwargs["json"]["playerId"] == 12345
         assert kwargs["json"]["limit"] == 10
 
-    @patch("dupr_api.client.requests.Session.request")
-    def test_search_matches_with_filters(self, mock_request, client):
+    def test_search_matches_with_filters(self, mock_request, client, make_response):
         """Test searching matches with multiple filters."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"result": []}
-        mock_response.content = b'{"result": []}'
-        mock_request.return_value = mock_response
+        mock_request.return_value = make_response({"result": []})
 
         result = client.matches.search_matches(
             player_id=12345,
@@ -102,23 +110,54 @@ class TestMatchesAPI:
             limit=20
         )
 
-        mock_request.assert_called_once()
+        assert mock_request.call_count == 1
         args, kwargs = mock_request.call_args
         json_data = kwargs["json"]
         assert json_data["playerId"] == 12345
         assert json_data["clubId"] == 100
         assert json_data["eventId"] == 500
 
-    @patch("dupr_api.client.requests.Session.request")
-    def test_update_match(self, mock_request, client):
+    def test_search_matches_adaptive_limit(self, mock_request, client, make_response):
+        """Test that the adaptive page size grows after fast pages."""
+        mock_request.return_value = make_response({"result": []})
+
+        for _ in range(4):
+            client.matches.search_matches(player_id=12345, adaptive=True, cap=50)
+
+        # Mocked responses are instant, so the limit doubles up to the cap
+        limits = [c.kwargs["json"]["limit"] for c in mock_request.call_args_list]
+        assert limits == [10, 20, 40, 50]
+
+    def test_search_matches_adaptive_cap_below_initial(
+        self, mock_request, client, make_response
+    ):
+        """Test that the first adaptive page never exceeds the cap."""
+        mock_request.return_value = make_response({"result": []})
+
+        client.matches.search_matches(player_id=12345, adaptive=True, cap=5)
+
+        assert mock_request.call_args.kwargs["json"]["limit"] == 5
+
+    def test_iter_matches(self, mock_request, client, make_response):
+        """Test iterating matches across pages."""
+        mock_request.side_effect = [
+            make_response({"result": [{"matchId": 1}, {"matchId": 2}]}),
+            make_response({"result": [{"matchId": 3}]}),
+        ]
+
+        matches = list(client.matches.iter_matches(player_id=12345, page_size=2))
+
+        assert [m["matchId"] for m in matches] == [1, 2, 3]
+        # Two full fetches: the short second page stops the iteration
+        assert mock_request.call_count == 2
+        offsets = [c.kwargs["json"]["offset"] for c in mock_request.call_args_list]
+        assert offsets == [0, 2]
+
+    def test_update_match(self, mock_request, client, make_response):
         """Test updating a match."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_request.return_value = make_response({
             "result": {"matchId": 789, "updated": True}
-        }
-        mock_response.content = b'{"result": {}}'
-        mock_request.return_value = mock_response
+        })
 
         match_data = {
             "matchId": 789,
@@ -127,16 +166,11 @@ class TestMatchesAPI:
         result = client.matches.update_match(match_data)
 
         assert result["result"]["updated"] is True
-        mock_request.assert_called_once()
+        assert mock_request.call_count == 1
 
-    @patch("dupr_api.client.requests.Session.request")
-    def test_save_verified_match(self, mock_request, client):
+    def test_save_verified_match(self, mock_request, client, make_response):
         """Test saving a verified match."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True}
-        mock_response.content = b'{"success": true}'
-        mock_request.return_value = mock_response
+        mock_request.return_value = make_response({"success": True})
 
         match_data = {
             "format": "doubles",
@@ -145,40 +179,46 @@ class TestMatchesAPI:
         result = client.matches.save_verified_match(match_data)
 
         assert result["success"] is True
-        mock_request.assert_called_once()
+        assert mock_request.call_count == 1
         args, kwargs = mock_request.call_args
         assert "/match/verified/v1.0/save" in kwargs["url"]
 
-    @patch("dupr_api.client.requests.Session.request")
-    def test_delete_match(self, mock_request, client):
+    def test_delete_match(self, mock_request, client, make_response):
         """Test deleting a match."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True}
-        mock_response.content = b'{"success": true}'
-        mock_request.return_value = mock_response
+        mock_request.return_value = make_response({"success": True})
 
         result = client.matches.delete_match(match_id=789)
 
         assert result["success"] is True
-        mock_request.assert_called_once()
+        assert mock_request.call_count == 1
         args, kwargs = mock_request.call_args
         assert kwargs["method"] == "DELETE"
         assert "789" in kwargs["url"]
 
-    @patch("dupr_api.client.requests.Session.request")
-    def test_get_match_rating_impact(self, mock_request, client):
+    def test_save_match_prefetches_details(self, mock_request, make_response):
+        """Test that save_match warms the follow-up get_match."""
+        mock_request.side_effect = [
+            make_response({"result": 12345}),
+            make_response({"result": {"matchId": 12345}}),
+        ]
+
+        client = DUPRClient(bearer_token="test_token", prefetch=True)
+        result = client.matches.save_match({"format": "singles"})
+        assert result["result"] == 12345
+
+        # The follow-up read is served by the background prefetch
+        match = client.matches.get_match(match_id=12345)
+        assert match["result"]["matchId"] == 12345
+        assert mock_request.call_count == 2
+
+    def test_get_match_rating_impact(self, mock_request, client, make_response):
         """Test getting match rating impact simulation."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_request.return_value = make_response({
             "result": {
                 "team1Impact": 0.05,
                 "team2Impact": -0.05
             }
-        }
-        mock_response.content = b'{"result": {}}'
-        mock_request.return_value = mock_response
+        })
 
         match_data = {
             "team1": [{"playerId": 123, "rating": 4.5}],
@@ -187,6 +227,6 @@ class TestMatchesAPI:
         result = client.matches.get_match_rating_impact(match_data)
 
         assert "result" in result
-        mock_request.assert_called_once()
+        assert mock_request.call_count == 1
         args, kwargs = mock_request.call_args
         assert "/match/v1.0/rating-simulator" in kwargs["url"]
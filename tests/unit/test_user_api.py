@@ -1,150 +1,142 @@
 """Unit tests for User API."""
 
+import sys
+
 import pytest
-from unittest.mock import Mock, patch
-from dupr_api import DUPRClient
+
+# Expected URLs, interned once so repeated comparisons across
+# parametrized rows hit the fast identity path
+_URL_PROFILE = sys.intern("https://backend.mydupr.com/user/v1.0/profile")
+_URL_SETTINGS = sys.intern("https://backend.mydupr.com/user/v1.0/settings")
+_URL_PREFERENCES = sys.intern("https://backend.mydupr.com/user/v1.0/preferences")
+
+# Canned payloads built once at import instead of per test invocation
+_PROFILE_PAYLOAD = {
+    "result": {
+        "userId": 12345,
+        "fullName": "John Doe",
+        "email": "john@example.com",
+    }
+}
+_UPDATED_PROFILE = {"fullName": "John Updated"}
+_SETTINGS_PAYLOAD = {"result": {"emailNotifications": True, "privacyMode": "public"}}
+_SETTINGS_UPDATE = {"emailNotifications": False}
+_PREFERENCES_UPDATE = {"preferredFormat": "doubles"}
+_SUCCESS_PAYLOAD = {"success": True}
+_EMPTY_RESULT = {"result": {}}
+_ACTIVITIES_PAYLOAD = {
+    "result": [{"activityType": "match", "timestamp": "2024-01-01T00:00:00Z"}]
+}
 
 
 class TestUserAPI:
     """Test suite for User API endpoints."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def client(self):
-        """Create a test client."""
-        return DUPRClient(bearer_token="test_token")
+        """Create a test client, shared across the run.
 
-    @patch("dupr_api.client.requests.Session.request")
-    def test_get_profile(self, mock_request, client):
-        """Test getting user profile."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "result": {
-                "userId": 12345,
-                "fullName": "John Doe",
-                "email": "john@example.com"
-            }
-        }
-        mock_response.content = b'{"result": {}}'
-        mock_request.return_value = mock_response
-
-        result = client.user.get_profile()
-
-        assert "result" in result
-        assert result["result"]["userId"] == 12345
-        mock_request.assert_called_once()
-        args, kwargs = mock_request.call_args
-        assert kwargs["url"] == "https://backend.mydupr.com/user/v1.0/profile"
-        assert kwargs["method"] == "GET"
-
-    @patch("dupr_api.client.requests.Session.request")
-    def test_update_profile(self, mock_request, client):
-        """Test updating user profile."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "result": {
-                "fullName": "John Updated"
-            }
-        }
-        mock_response.content = b'{"result": {}}'
-        mock_request.return_value = mock_response
-
-        profile_data = {"fullName": "John Updated"}
-        result = client.user.update_profile(profile_data)
+        No test here mutates the client, and Session.request is patched
+        per test, so one DUPRClient (and its Session setup) serves the
+        whole suite instead of being rebuilt for every test. The import
+        lives here rather than at module top so collecting this file
+        (e.g. with -k) never pulls in the client package.
+        """
+        from dupr_api import DUPRClient
 
-        assert "result" in result
-        mock_request.assert_called_once()
-        args, kwargs = mock_request.call_args
-        assert kwargs["url"] == "https://backend.mydupr.com/user/v1.0/profile"
-        assert kwargs["method"] == "PUT"
-        assert kwargs["json"] == profile_data
-
-    @patch("dupr_api.client.requests.Session.request")
-    def test_get_settings(self, mock_request, client):
-        """Test getting user settings."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "result": {
-                "emailNotifications": True,
-                "privacyMode": "public"
-            }
-        }
-        mock_response.content = b'{"result": {}}'
-        mock_request.return_value = mock_response
-
-        result = client.user.get_settings()
+        return DUPRClient(bearer_token="test_token")
 
-        assert "result" in result
-        mock_request.assert_called_once()
-
-    @patch("dupr_api.client.requests.Session.request")
-    def test_update_settings(self, mock_request, client):
-        """Test updating user settings."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True}
-        mock_response.content = b'{"success": true}'
-        mock_request.return_value = mock_response
-
-        settings = {"emailNotifications": False}
-        result = client.user.update_settings(settings)
-
-        assert result["success"] is True
-        mock_request.assert_called_once()
-        args, kwargs = mock_request.call_args
-        assert kwargs["json"] == settings
-
-    @patch("dupr_api.client.requests.Session.request")
-    def test_update_preferences(self, mock_request, client):
-        """Test updating user preferences."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True}
-        mock_response.content = b'{"success": true}'
-        mock_request.return_value = mock_response
-
-        preferences = {"preferredFormat": "doubles"}
-        result = client.user.update_preferences(preferences)
-
-        assert result["success"] is True
-        mock_request.assert_called_once()
-        args, kwargs = mock_request.call_args
-        assert kwargs["url"] == "https://backend.mydupr.com/user/v1.0/preferences"
-
-    @patch("dupr_api.client.requests.Session.request")
-    def test_get_activities(self, mock_request, client):
+    @pytest.fixture(scope="session")
+    def user_api(self, client):
+        """Resolve the user namespace once instead of per call."""
+        return client.user
+
+    @pytest.mark.parametrize(
+        "attr,call_kwargs,payload,url,http_method,json_body",
+        [
+            (
+                "get_profile",
+                {},
+                _PROFILE_PAYLOAD,
+                _URL_PROFILE,
+                "GET",
+                None,
+            ),
+            (
+                "update_profile",
+                {"profile_data": _UPDATED_PROFILE},
+                {"result": _UPDATED_PROFILE},
+                _URL_PROFILE,
+                "PUT",
+                _UPDATED_PROFILE,
+            ),
+            (
+                "get_settings",
+                {},
+                _SETTINGS_PAYLOAD,
+                _URL_SETTINGS,
+                "GET",
+                None,
+            ),
+            (
+                "update_settings",
+                {"settings": _SETTINGS_UPDATE},
+                _SUCCESS_PAYLOAD,
+                _URL_SETTINGS,
+                "PUT",
+                _SETTINGS_UPDATE,
+            ),
+            (
+                "update_preferences",
+                {"preferences": _PREFERENCES_UPDATE},
+                _SUCCESS_PAYLOAD,
+                _URL_PREFERENCES,
+                "PUT",
+                _PREFERENCES_UPDATE,
+            ),
+        ],
+    )
+    def test_endpoint_request_shape(
+        self, mock_request, user_api, make_response,
+        attr, call_kwargs, payload, url, http_method, json_body,
+    ):
+        """Test each endpoint's URL, HTTP method, and body in one table.
+
+        The per-endpoint tests were structurally identical (configure
+        mock, call, assert on call_args), so one parametrized test
+        keeps the same assertions without the copy-paste.
+        """
+        mock_request.return_value = make_response(payload)
+
+        result = getattr(user_api, attr)(**call_kwargs)
+
+        assert result == payload
+        call = mock_request.call_args
+        assert mock_request.call_count == 1
+        kwargs = call.kwargs
+        assert kwargs["url"] == url
+        assert kwargs["method"] == http_method
+        assert kwargs["json"] == json_body
+
+    def test_get_activities(self, mock_request, user_api, make_response):
         """Test getting user activities."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "result": [
-                {"activityType": "match", "timestamp": "2024-01-01T00:00:00Z"}
-            ]
-        }
-        mock_response.content = b'{"result": []}'
-        mock_request.return_value = mock_response
-
-        result = client.user.get_activities(player_id=12345, limit=10)
+        mock_request.return_value = make_response(_ACTIVITIES_PAYLOAD)
+
+        result = user_api.get_activities(player_id=12345, limit=10)
 
         assert "result" in result
-        mock_request.assert_called_once()
-        args, kwargs = mock_request.call_args
-        assert "12345" in kwargs["url"]
-        assert kwargs["params"]["limit"] == 10
+        call = mock_request.call_args
+        assert mock_request.call_count == 1
+        kwargs = call.kwargs
+        params = kwargs["params"]
+        assert params["limit"] == 10 and "12345" in kwargs["url"]
 
-    @patch("dupr_api.client.requests.Session.request")
-    def test_custom_version(self, mock_request, client):
+    def test_custom_version(self, mock_request, user_api, make_response):
         """Test using custom API version."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"result": {}}
-        mock_response.content = b'{"result": {}}'
-        mock_request.return_value = mock_response
+        mock_request.return_value = make_response(_EMPTY_RESULT)
 
-        result = client.user.get_profile(version="v2.0")
+        result = user_api.get_profile(version="v2.0")
 
-        mock_request.assert_called_once()
-        args, kwargs = mock_request.call_args
-        assert "v2.0" in kwargs["url"]
+        call = mock_request.call_args
+        assert mock_request.call_count == 1
+        assert "v2.0" in call.kwargs["url"]